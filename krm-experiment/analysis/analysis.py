@@ -13,12 +13,28 @@ Usage:
 
 import os
 import sys
+import tempfile
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless: never probe for a GUI backend
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    # Optional: enables the Arrow CSV reader/writer and the Parquet cache
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
 # ── Configuration ─────────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -27,50 +43,189 @@ RESULTS_DIR = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESULTS_DIR
 OUTPUT_DIR = RESULTS_DIR / "plots"
 RESOLUTIONS = ["60s", "30s", "15s"]
 TARGET_UTIL = 60  # target CPU utilization %
+SUMMARY_COLUMNS = [
+    "time_to_scale_up_s",
+    "time_to_stabilize_s",
+    "max_replicas",
+    "avg_cpu_util",
+    "overshoot_undershoot_area",
+    "pod_seconds",
+    "pod_cpu_std_dev",
+]
+# Fixed figure margins: cheaper than a tight_layout() measurement pass
+FIG_MARGINS = dict(left=0.07, right=0.98, top=0.92, bottom=0.12)
+MAX_PLOT_POINTS = 2000  # per line; longer series are stride-decimated
+
+# Explicit column dtypes so the CSV reader skips type inference. Numeric
+# columns are read as text and coerced by load_csv, so blanks and values
+# like "<unknown>" become NaN instead of failing the whole read; nothing
+# downstream needs pd.to_numeric. They end up float64 because the collector
+# leaves replica counts blank until the HPA reports its first status.
+NUMERIC_COLUMNS = ["currentReplicas", "desiredReplicas", "currentCPUUtilizationPercent"]
+SCHEMAS = {
+    "hpa_log.csv": {col: str for col in NUMERIC_COLUMNS},
+    "pod_cpu.csv": {"pod": str, "cpu": str, "memory": str},
+}
+# Parquet sidecars record CACHE_VERSION and the file's schema and are ignored
+# when either differs. Bump it whenever load_csv or _timestamps_to_seconds
+# changes what they return.
+CACHE_VERSION = 2
+CACHE_META_KEY = b"krm_analysis_cache"
 
 # ── Data Loading ──────────────────────────────────────────────────────────────
 
 
 def load_csv(run_dir: Path, filename: str) -> pd.DataFrame:
-    """Load a CSV file from a run directory, return empty DataFrame if missing."""
+    """Load a CSV file from a run directory, return empty DataFrame if missing.
+
+    When pyarrow is available, the file is parsed with its multi-threaded
+    CSV engine and the result is cached as a .parquet sidecar next to the
+    CSV. The sidecar is reused until the CSV is modified, CACHE_VERSION or
+    the file's schema changes, or it fails to read.
+    """
     filepath = run_dir / filename
     if not filepath.exists():
         print(f"  [WARN] Missing: {filepath}")
         return pd.DataFrame()
-    df = pd.read_csv(filepath, parse_dates=["timestamp"])
+    cache_path = filepath.with_suffix(".parquet")
+    cache_key = f"{CACHE_VERSION}:{SCHEMAS.get(filename)!r}".encode()
+    if (
+        HAVE_PYARROW
+        and cache_path.exists()
+        and cache_path.stat().st_mtime >= filepath.stat().st_mtime
+    ):
+        cached = _read_parquet_cache(cache_path, cache_key)
+        if cached is not None:
+            return _timestamps_to_seconds(cached)
+    df = pd.read_csv(
+        filepath,
+        engine="pyarrow" if HAVE_PYARROW else "c",
+        dtype=SCHEMAS.get(filename),
+        parse_dates=["timestamp"],
+    )
+    for col in df.columns.intersection(NUMERIC_COLUMNS):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = _timestamps_to_seconds(df)
+    if HAVE_PYARROW:
+        _write_parquet_cache(df, cache_path, cache_key)
     return df
 
 
+def _read_parquet_cache(cache_path: Path, cache_key: bytes):
+    """Return the cached DataFrame, or None if the sidecar is stale or unreadable."""
+    try:
+        table = pq.read_table(cache_path)
+    except (OSError, ValueError, pa.ArrowException):
+        return None  # truncated or corrupt sidecar: reparse the CSV
+    if (table.schema.metadata or {}).get(CACHE_META_KEY) != cache_key:
+        return None
+    return table.to_pandas()
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: Path, cache_key: bytes):
+    """Write the sidecar via a temp file so an interrupted run never leaves a partial one."""
+    table = pa.Table.from_pandas(df)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_META_KEY: cache_key})
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{cache_path.stem}.", suffix=".parquet", dir=cache_path.parent)
+        os.close(fd)
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except (OSError, pa.ArrowException):
+        pass  # read-only results dir or failed write: skip the cache
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def load_phases(run_dir: Path) -> pd.DataFrame:
     """Load phases.log."""
     filepath = run_dir / "phases.log"
     if not filepath.exists():
         return pd.DataFrame()
     df = pd.read_csv(filepath, parse_dates=["timestamp"])
+    return _timestamps_to_seconds(df)
+
+
+def _timestamps_to_seconds(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the timestamp column at second resolution.
+
+    The collectors log whole seconds and every derived metric works in
+    seconds, so nanosecond precision is never needed. pandas < 2.0 only
+    has nanosecond datetimes, so there the column is left as is.
+    """
+    if "timestamp" in df.columns and pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        if hasattr(df["timestamp"].dt, "as_unit"):
+            df["timestamp"] = df["timestamp"].dt.as_unit("s")
     return df
 
 
+def _seconds_since_start(timestamps: pd.Series) -> np.ndarray:
+    """Return int32 seconds elapsed since the first timestamp."""
+    # total_seconds() is unit-agnostic, unlike an int64 view of the values
+    elapsed = (timestamps - timestamps.iloc[0]).dt.total_seconds().to_numpy()
+    return elapsed.astype(np.int32)
+
+
+def _load_one(run_dir: Path) -> dict:
+    """Load all CSV logs for a single resolution run.
+
+    Also precomputes "minutes": hpa_log timestamps as minutes since the
+    first sample, shared by all plots.
+    """
+    hpa = load_csv(run_dir, "hpa_log.csv")
+    if hpa.empty:
+        minutes = np.empty(0)
+    else:
+        minutes = _seconds_since_start(hpa["timestamp"]) / 60
+    return {
+        "pod_cpu": load_csv(run_dir, "pod_cpu.csv"),
+        "hpa_log": hpa,
+        "podcount": load_csv(run_dir, "podcount.csv"),
+        "phases": load_phases(run_dir),
+        "minutes": minutes,
+    }
+
+
 def load_all_runs():
-    """Load data for all resolution runs."""
-    data = {}
+    """Load data for all resolution runs.
+
+    Runs are loaded concurrently: the work is file IO and C-level CSV
+    parsing, both of which release the GIL.
+    """
+    run_dirs = {}
     for res in RESOLUTIONS:
         run_dir = RESULTS_DIR / res
         if not run_dir.exists():
             print(f"[SKIP] No data for {res}")
             continue
         print(f"[LOAD] {res}...")
-        data[res] = {
-            "pod_cpu": load_csv(run_dir, "pod_cpu.csv"),
-            "hpa_log": load_csv(run_dir, "hpa_log.csv"),
-            "podcount": load_csv(run_dir, "podcount.csv"),
-            "phases": load_phases(run_dir),
-        }
-    return data
+        run_dirs[res] = run_dir
+    if not run_dirs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(run_dirs)) as ex:
+        futures = {res: ex.submit(_load_one, run_dir) for res, run_dir in run_dirs.items()}
+        # Collect in RESOLUTIONS order so plots and the summary stay stable
+        return {res: fut.result() for res, fut in futures.items()}
 
 
 # ── Derived Metrics ───────────────────────────────────────────────────────────
 
 
+def _first_stable_run(seconds: np.ndarray, replicas: np.ndarray, min_duration_s: float = 60) -> int:
+    """Return the index where the first run of identical consecutive replica
+    counts lasting at least min_duration_s starts, or -1 if there is none.
+
+    NaN never equals its neighbour, so missing samples always break a run.
+    """
+    starts = np.flatnonzero(np.r_[True, replicas[1:] != replicas[:-1]])
+    ends = np.r_[starts[1:], len(replicas)] - 1
+    stable = np.flatnonzero(seconds[ends] - seconds[starts] >= min_duration_s)
+    return int(starts[stable[0]]) if stable.size else -1
+
+
 def compute_derived_metrics(run_data: dict) -> dict:
     """Compute derived metrics for a single experiment run."""
     hpa = run_data["hpa_log"]
@@ -80,94 +235,79 @@ def compute_derived_metrics(run_data: dict) -> dict:
     if hpa.empty or phases.empty:
         return metrics
 
+    # Pull each column out once; every metric below works on these arrays
+    cols = frozenset(hpa.columns)
+    seconds = _seconds_since_start(hpa["timestamp"])
+    replicas = hpa["currentReplicas"].to_numpy() if "currentReplicas" in cols else None
+    util = hpa["currentCPUUtilizationPercent"].to_numpy() if "currentCPUUtilizationPercent" in cols else None
+
     # Time-to-scale-up: time from first high-start to first replica increase
     high_starts = phases[(phases["phase"] == "high") & (phases["action"] == "start")]
-    if not high_starts.empty and not hpa.empty:
-        first_high = high_starts.iloc[0]["timestamp"]
-        initial_replicas = hpa.iloc[0]["currentReplicas"] if "currentReplicas" in hpa.columns else None
-        if initial_replicas is not None:
-            scaled = hpa[
-                (hpa["timestamp"] > first_high)
-                & (hpa["currentReplicas"] > initial_replicas)
-            ]
-            if not scaled.empty:
-                metrics["time_to_scale_up_s"] = (
-                    scaled.iloc[0]["timestamp"] - first_high
-                ).total_seconds()
+    if not high_starts.empty and replicas is not None:
+        first_high = high_starts["timestamp"].iat[0]
+        after_high = (hpa["timestamp"] > first_high).to_numpy()
+        scaled_idx = np.flatnonzero(after_high & (replicas > replicas[0]))
+        if scaled_idx.size:
+            metrics["time_to_scale_up_s"] = (
+                hpa["timestamp"].iat[scaled_idx[0]] - first_high
+            ).total_seconds()
 
     # Time-to-stabilize and stabilized start time
     stabilized_start_time = None
-    if "currentReplicas" in hpa.columns and len(hpa) > 1:
-        stable_start = None
-        for i in range(1, len(hpa)):
-            if hpa.iloc[i]["currentReplicas"] == hpa.iloc[i - 1]["currentReplicas"]:
-                if stable_start is None:
-                    stable_start = hpa.iloc[i - 1]["timestamp"]
-                elapsed = (hpa.iloc[i]["timestamp"] - stable_start).total_seconds()
-                if elapsed >= 60:
-                    first_high = high_starts.iloc[0]["timestamp"] if not high_starts.empty else hpa.iloc[0]["timestamp"]
-                    metrics["time_to_stabilize_s"] = (
-                        stable_start - first_high
-                    ).total_seconds()
-                    stabilized_start_time = stable_start
-                    break
-            else:
-                stable_start = None
+    if replicas is not None and len(hpa) > 1:
+        start_idx = _first_stable_run(seconds, replicas)
+        if start_idx >= 0:
+            stable_start = hpa["timestamp"].iat[start_idx]
+            first_high = high_starts["timestamp"].iat[0] if not high_starts.empty else hpa["timestamp"].iat[0]
+            metrics["time_to_stabilize_s"] = (
+                stable_start - first_high
+            ).total_seconds()
+            stabilized_start_time = stable_start
 
     # Max replicas
-    if "currentReplicas" in hpa.columns:
-        metrics["max_replicas"] = int(hpa["currentReplicas"].max())
-
-    # Average CPU utilization (during stabilized window)
-    if stabilized_start_time and "currentCPUUtilizationPercent" in hpa.columns:
-        cpu_vals = pd.to_numeric(hpa[hpa["timestamp"] >= stabilized_start_time]["currentCPUUtilizationPercent"], errors="coerce")
-        metrics["avg_cpu_util"] = round(cpu_vals.dropna().mean(), 1)
-    elif "currentCPUUtilizationPercent" in hpa.columns:
-        # Fallback to overall mean if no stabilization found
-        cpu_vals = pd.to_numeric(hpa["currentCPUUtilizationPercent"], errors="coerce")
-        metrics["avg_cpu_util"] = round(cpu_vals.dropna().mean(), 1)
+    if replicas is not None:
+        metrics["max_replicas"] = int(np.nanmax(replicas))
+
+    # Average CPU utilization (during stabilized window, else overall)
+    if util is not None:
+        if stabilized_start_time:
+            cpu_vals = util[(hpa["timestamp"] >= stabilized_start_time).to_numpy()]
+        else:
+            cpu_vals = util
+        cpu_vals = cpu_vals[~np.isnan(cpu_vals)]
+        metrics["avg_cpu_util"] = round(float(cpu_vals.mean()), 1) if cpu_vals.size else float("nan")
 
     # Overshoot/undershoot area: sum(abs(util - target) * dt)
-    if "currentCPUUtilizationPercent" in hpa.columns:
-        hpa_sorted = hpa.sort_values("timestamp")
-        area = 0.0
-        prev_time = hpa_sorted.iloc[0]["timestamp"]
-        for _, row in hpa_sorted.iterrows():
-            curr_time = row["timestamp"]
-            dt = (curr_time - prev_time).total_seconds()
-            util = pd.to_numeric(row["currentCPUUtilizationPercent"], errors="coerce")
-            if pd.notna(util):
-                # Simple rectangle integration
-                error = abs(util - TARGET_UTIL)
-                area += error * dt
-            prev_time = curr_time
-        metrics["overshoot_undershoot_area"] = round(area, 1)
+    if util is not None:
+        if hpa["timestamp"].is_monotonic_increasing:
+            # Simple rectangle integration; the first sample has dt = 0
+            dt = np.diff(seconds, prepend=seconds[0])
+            area = np.nansum(np.abs(util - TARGET_UTIL) * dt)
+        else:
+            hpa_sorted = hpa.sort_values("timestamp")
+            dt = hpa_sorted["timestamp"].diff().dt.total_seconds().fillna(0)
+            area = ((hpa_sorted["currentCPUUtilizationPercent"] - TARGET_UTIL).abs() * dt).sum()
+        metrics["overshoot_undershoot_area"] = round(float(area), 1)
 
     # Resource cost: sum(replicas * 5s) = pod-seconds
-    if "currentReplicas" in hpa.columns:
-        metrics["pod_seconds"] = int(hpa["currentReplicas"].sum() * 5)
+    if replicas is not None:
+        metrics["pod_seconds"] = int(np.nansum(replicas) * 5)
 
     # Pod CPU Variance/StdDev (load dispersion)
-    if "pod_cpu" in run_data and not run_data["pod_cpu"].empty:
-        df_cpu = run_data["pod_cpu"]
+    df_cpu = run_data.get("pod_cpu")
+    if df_cpu is not None and not df_cpu.empty:
         if "cpu" in df_cpu.columns:
              # Convert "100m" to float if needed, assuming clean float/int in CSV
              # The CSV collector stores raw kubectl output (e.g. 100m)
              # Need to clean it: remove 'm', convert to int. If no 'm', it's cores?
              # My collector clean-up logic isn't perfect, let's assume raw string
              # Actually, kubectl top pods returns "100m" or "1" (cores).
-             # I need to parse it.
-             def parse_cpu(val):
-                 val = str(val).strip()
-                 if val.endswith('m'):
-                     return int(val[:-1])
-                 return int(float(val) * 1000)
-             
-             try:
-                 cpu_milli = df_cpu["cpu"].apply(parse_cpu)
-                 metrics["pod_cpu_std_dev"] = round(cpu_milli.std(), 1)
-             except Exception:
-                 metrics["pod_cpu_std_dev"] = None
+             # Parse the whole column at once; unparsable values become NaN.
+             cpu_str = df_cpu["cpu"].astype(str).str.strip()
+             is_milli = cpu_str.str.endswith("m")
+             cpu_num = pd.to_numeric(cpu_str.str.rstrip("m"), errors="coerce")
+             cpu_milli = cpu_num.where(is_milli, np.trunc(cpu_num * 1000))
+             metrics["pod_cpu_std_dev"] = round(float(cpu_milli.std()), 1)
 
     return metrics
 
@@ -175,6 +315,17 @@ def compute_derived_metrics(run_data: dict) -> dict:
 # ── Plotting ──────────────────────────────────────────────────────────────────
 
 
+def _steps_post(x, y):
+    """Return the vertices of a steps-post line through (x, y)."""
+    return np.repeat(x, 2)[1:], np.repeat(y, 2)[:-1]
+
+
+def _decimate(x, y, max_points: int = MAX_PLOT_POINTS):
+    """Stride-decimate a series to at most max_points points for plotting."""
+    step = max(1, -(-len(x) // max_points))
+    return x[::step], y[::step]
+
+
 def plot_replicas_over_time(data: dict):
     """Plot pod replicas vs time for all resolutions."""
     fig, ax = plt.subplots(figsize=(14, 6))
@@ -182,17 +333,16 @@ def plot_replicas_over_time(data: dict):
         hpa = run_data["hpa_log"]
         if hpa.empty or "currentReplicas" not in hpa.columns:
             continue
-        # Normalize time to minutes from start
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-        ax.plot(minutes, hpa["currentReplicas"], label=f"resolution={res}", linewidth=1.5)
+        minutes = run_data["minutes"]  # minutes from start
+        x, y = _decimate(minutes, hpa["currentReplicas"].to_numpy())
+        ax.plot(x, y, label=f"resolution={res}", linewidth=1.5, drawstyle="steps-post")
 
     ax.set_xlabel("Time (minutes)")
     ax.set_ylabel("Replicas")
     ax.set_title("Pod Replicas Over Time (by metric-resolution)")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**FIG_MARGINS)
     fig.savefig(OUTPUT_DIR / "replicas_over_time.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'replicas_over_time.png'}")
@@ -205,10 +355,9 @@ def plot_cpu_over_time(data: dict):
         hpa = run_data["hpa_log"]
         if hpa.empty or "currentCPUUtilizationPercent" not in hpa.columns:
             continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-        cpuutil = pd.to_numeric(hpa["currentCPUUtilizationPercent"], errors="coerce")
-        ax.plot(minutes, cpuutil, label=f"resolution={res}", linewidth=1.5)
+        minutes = run_data["minutes"]
+        cpuutil = hpa["currentCPUUtilizationPercent"].to_numpy()
+        ax.plot(*_decimate(minutes, cpuutil), label=f"resolution={res}", linewidth=1.5)
 
     ax.axhline(y=TARGET_UTIL, color="red", linestyle="--", alpha=0.7, label=f"Target ({TARGET_UTIL}%)")
     ax.set_xlabel("Time (minutes)")
@@ -216,7 +365,7 @@ def plot_cpu_over_time(data: dict):
     ax.set_title("HPA CPU Utilization Over Time (by metric-resolution)")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**FIG_MARGINS)
     fig.savefig(OUTPUT_DIR / "cpu_over_time.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'cpu_over_time.png'}")
@@ -235,20 +384,31 @@ def plot_desired_vs_current(data: dict):
         hpa = run_data["hpa_log"]
         if hpa.empty:
             continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-        if "currentReplicas" in hpa.columns:
-            ax.plot(minutes, hpa["currentReplicas"], label="current", linewidth=1.5)
-        if "desiredReplicas" in hpa.columns:
-            ax.plot(minutes, hpa["desiredReplicas"], label="desired", linestyle="--", linewidth=1.5)
+        minutes = run_data["minutes"]
+        # Draw both series as one LineCollection instead of two Line2D artists
+        segments, colors, styles, handles = [], [], [], []
+        for col, color, style, label in (
+            ("currentReplicas", "C0", "-", "current"),
+            ("desiredReplicas", "C1", "--", "desired"),
+        ):
+            if col not in hpa.columns:
+                continue
+            x, y = _decimate(minutes, hpa[col].to_numpy())
+            segments.append(np.column_stack(_steps_post(x, y)))
+            colors.append(color)
+            styles.append(style)
+            handles.append(Line2D([], [], color=color, linestyle=style, linewidth=1.5, label=label))
+        if segments:
+            ax.add_collection(LineCollection(segments, colors=colors, linestyles=styles, linewidths=1.5))
+            ax.autoscale_view()
         ax.set_title(f"resolution={res}")
         ax.set_xlabel("Time (min)")
-        ax.legend()
+        ax.legend(handles=handles, loc="lower right")  # "best" ignores collections
         ax.grid(True, alpha=0.3)
 
     axes[0].set_ylabel("Replicas")
     fig.suptitle("HPA Desired vs Current Replicas", fontsize=14)
-    fig.tight_layout()
+    fig.subplots_adjust(**{**FIG_MARGINS, "top": 0.85})  # room for suptitle
     fig.savefig(OUTPUT_DIR / "desired_vs_current.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'desired_vs_current.png'}")
@@ -268,17 +428,22 @@ def plot_efficiency_scatter(data: dict):
         if df.empty:
             continue
 
-        replicas = df["currentReplicas"]
-        cpu = pd.to_numeric(df["currentCPUUtilizationPercent"], errors="coerce")
-        
-        ax.scatter(replicas, cpu, alpha=0.4, s=30, label=f"resolution={res}")
+        # Bucket repeated (replicas, cpu%) samples into one marker sized by count
+        buckets = df.groupby(
+            [df["currentReplicas"], df["currentCPUUtilizationPercent"].round()]
+        ).size()
+        replicas = buckets.index.get_level_values(0).to_numpy()
+        cpu = buckets.index.get_level_values(1).to_numpy()
+        sizes = 30 * np.sqrt(buckets.to_numpy())
+
+        ax.scatter(replicas, cpu, alpha=0.4, s=sizes, label=f"resolution={res}", rasterized=True)
 
     ax.set_xlabel("Replicas")
     ax.set_ylabel("CPU Utilization (%)")
     ax.set_title("Scaling Efficiency: CPU vs Replicas")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**FIG_MARGINS)
     fig.savefig(OUTPUT_DIR / "efficiency_scatter.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'efficiency_scatter.png'}")
@@ -318,11 +483,23 @@ def main():
 
     # Summary table
     if summary:
-        df_summary = pd.DataFrame(summary).T
-        df_summary.index.name = "metric_resolution"
+        # Every metric some run produced: known ones in SUMMARY_COLUMNS order,
+        # anything else after them in first-seen order
+        produced = dict.fromkeys(k for metrics in summary.values() for k in metrics)
+        columns = [c for c in SUMMARY_COLUMNS if c in produced]
+        columns += [c for c in produced if c not in SUMMARY_COLUMNS]
+        df_summary = pd.DataFrame(
+            list(summary.values()),
+            index=pd.Index(list(summary.keys()), name="metric_resolution"),
+            columns=columns,
+        )
         print("\n=== Summary Table ===")
         print(df_summary.to_string())
-        df_summary.to_csv(OUTPUT_DIR / "summary_table.csv")
+        if HAVE_PYARROW:
+            table = pa.Table.from_pandas(df_summary.reset_index(), preserve_index=False)
+            pacsv.write_csv(table, str(OUTPUT_DIR / "summary_table.csv"))
+        else:
+            df_summary.to_csv(OUTPUT_DIR / "summary_table.csv")
         print(f"\n  → {OUTPUT_DIR / 'summary_table.csv'}")
 
     print("\n[DONE] All outputs in:", OUTPUT_DIR)
@@ -14,10 +14,15 @@ Usage:
 import os
 import sys
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
+    import numpy as np
     import pandas as pd
+    import matplotlib
+
+    matplotlib.use("Agg")  # plots are only saved as PNGs under OUTPUT_DIR
     import matplotlib.pyplot as plt
 except ImportError as e:
     print("\n[ERROR] Missing Python dependencies.")
@@ -29,6 +34,12 @@ except ImportError as e:
     print("  pip install pandas matplotlib")
     sys.exit(1)
 
+try:
+    import pyarrow  # noqa: F401 — optional, enables the Arrow CSV engine
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 # ── Configuration ─────────────────────────────────────────────────────────────
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -36,6 +47,43 @@ DEFAULT_RESULTS_DIR = SCRIPT_DIR.parent / "results"
 RESULTS_DIR = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESULTS_DIR
 OUTPUT_DIR = RESULTS_DIR / "plots"
 TARGET_CPU_UTIL = 60  # target CPU utilization %
+# Metrics are kept at full precision and only rounded when written out
+FLOAT_FORMAT = "%.2f"
+# Default subplots_adjust margins for the wide time-series figures; figures
+# with a suptitle or narrower axes override top/left/wspace at the call site
+FIG_MARGINS = dict(left=0.07, right=0.98, top=0.92, bottom=0.1)
+MAX_PLOT_POINTS = 2000  # per line; longer series are LTTB-downsampled
+
+# Numeric columns across all collector CSVs. SCHEMAS reads them as text and
+# load_csv coerces them once, turning blanks and other non-numeric cells
+# (e.g. "<unknown>") into NaN rather than failing the whole read.
+NUMERIC_COLUMNS = frozenset(
+    {
+        "currentReplicas",
+        "desiredReplicas",
+        "currentCPUUtilizationPercent",
+        "total_rps",
+        "per_pod_avg_rps",
+        "value",
+    }
+)
+
+# Columns the HPA reports as Kubernetes quantities ("1936m" is 1.936, a bare
+# number is taken as-is); load_csv converts them to plain floats.
+QUANTITY_COLUMNS = frozenset({"httpRequestsPerSecond"})
+
+# Explicit per-file dtypes so the CSV reader skips type inference.
+SCHEMAS = {
+    "hpa_log.csv": {
+        "currentReplicas": str,
+        "desiredReplicas": str,
+        "currentCPUUtilizationPercent": str,
+        "httpRequestsPerSecond": str,
+    },
+    "http_rps.csv": {"total_rps": str, "per_pod_avg_rps": str},
+    "pod_cpu.csv": {"pod": str, "cpu": str, "memory": str},
+    "prometheus_metrics.csv": {"metric": str, "pod": str, "value": str},
+}
 
 # Experiment directories to look for
 EXPERIMENT_DIRS = {
@@ -51,53 +99,223 @@ EXPERIMENT_DIRS = {
 
 # ── Data Loading ──────────────────────────────────────────────────────────────
 
+# Paths under RESULTS_DIR, filled by load_all_runs() from a single directory
+# walk so per-file existence checks don't each cost a stat() call
+_PRESENT_PATHS = None
+
+
+def scan_results(root: Path) -> set:
+    """Return every directory and file path under root from one os.walk."""
+    present = set()
+    for dirpath, _, filenames in os.walk(root, followlinks=True):
+        base = Path(dirpath)
+        present.add(base)
+        present.update(base / name for name in filenames)
+    return present
+
+
+def path_exists(path: Path) -> bool:
+    if _PRESENT_PATHS is None:
+        return path.exists()
+    return path in _PRESENT_PATHS
+
 
 def load_csv(run_dir: Path, filename: str) -> pd.DataFrame:
     """Load a CSV file from a run directory, return empty DataFrame if missing."""
     filepath = run_dir / filename
-    if not filepath.exists():
+    if not path_exists(filepath):
         print(f"  [WARN] Missing: {filepath}")
         return pd.DataFrame()
-    df = pd.read_csv(filepath, parse_dates=["timestamp"])
+    df = pd.read_csv(
+        filepath,
+        engine=CSV_ENGINE,
+        dtype=SCHEMAS.get(filename),
+        parse_dates=["timestamp"],
+    )
+    # Coerce once here so analysis and plotting code can use them directly
+    for col in NUMERIC_COLUMNS.intersection(df.columns):
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in QUANTITY_COLUMNS.intersection(df.columns):
+        df[col] = parse_quantity(df[col])
     return df
 
 
+def parse_quantity(series: pd.Series) -> pd.Series:
+    """Convert Kubernetes quantities ("861m", "2") to floats; NaN if unparseable."""
+    text = series.astype(str).str.strip()
+    is_milli = text.str.endswith("m")
+    values = pd.to_numeric(text.str.rstrip("m"), errors="coerce")
+    return values.where(~is_milli, values / 1000)
+
+
 def load_phases(run_dir: Path) -> pd.DataFrame:
     filepath = run_dir / "phases.log"
-    if not filepath.exists():
+    if not path_exists(filepath):
         return pd.DataFrame()
     df = pd.read_csv(filepath, parse_dates=["timestamp"])
     return df
 
 
+def load_optional_csv(run_dir: Path, filename: str) -> pd.DataFrame:
+    """Like load_csv, but silently empty for collectors that may not have run."""
+    if not path_exists(run_dir / filename):
+        return pd.DataFrame()
+    return load_csv(run_dir, filename)
+
+
+# run_data key → loader(run_dir)
+RUN_FILES = {
+    "pod_cpu": lambda run_dir: load_csv(run_dir, "pod_cpu.csv"),
+    "hpa_log": lambda run_dir: load_csv(run_dir, "hpa_log.csv"),
+    "podcount": lambda run_dir: load_csv(run_dir, "podcount.csv"),
+    "phases": load_phases,
+    "prometheus": lambda run_dir: load_optional_csv(run_dir, "prometheus_metrics.csv"),
+    # Dedicated HTTP req/s collector output (new)
+    "http_rps": lambda run_dir: load_optional_csv(run_dir, "http_rps.csv"),
+}
+# Files every run's metrics and plots read; loaded in parallel up front.
+# The rest stay lazy: podcount is unused, and get_http_rps_series reads
+# prometheus only when http_rps and the HPA log have no req/s data.
+PREFETCH_KEYS = ("hpa_log", "phases", "pod_cpu", "http_rps")
+
+
+class LazyRun:
+    """Run data that reads each CSV on first access and caches it.
+
+    Supports the dict-style access the analysis code uses
+    (run_data["hpa_log"], run_data.get("prometheus", ...)); both forms
+    parse the file, so callers fetch a key only once they need it.
+    podcount.csv is never read, and prometheus_metrics.csv only when
+    neither http_rps.csv nor the HPA log has req/s data.
+    """
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = run_dir
+        self._cache = {}
+        self._pending = {}
+
+    def prefetch(self, executor, keys):
+        """Start loading keys on executor; __getitem__ picks up the result."""
+        for key in keys:
+            if key not in self._cache and key not in self._pending:
+                self._pending[key] = executor.submit(RUN_FILES[key], self.run_dir)
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            pending = self._pending.pop(key, None)
+            if pending is not None:
+                self._cache[key] = pending.result()
+            else:
+                self._cache[key] = RUN_FILES[key](self.run_dir)
+        return self._cache[key]
+
+    def __contains__(self, key):
+        return key in RUN_FILES
+
+    def get(self, key, default=None):
+        return self[key] if key in RUN_FILES else default
+
+
 def load_all_runs():
-    """Load data for all experiment runs that exist."""
+    """Find all experiment runs that exist and read their common CSVs.
+
+    PREFETCH_KEYS are read concurrently across all runs (pandas releases
+    the GIL while parsing); any other file loads lazily on first access.
+    """
+    global _PRESENT_PATHS
+    _PRESENT_PATHS = scan_results(RESULTS_DIR)
+
     data = {}
     for label, subdir in EXPERIMENT_DIRS.items():
         run_dir = RESULTS_DIR / subdir
-        if not run_dir.exists():
+        if not path_exists(run_dir):
             print(f"[SKIP] No data for {label} ({run_dir})")
             continue
         print(f"[LOAD] {label}...")
-        data[label] = {
-            "pod_cpu": load_csv(run_dir, "pod_cpu.csv"),
-            "hpa_log": load_csv(run_dir, "hpa_log.csv"),
-            "podcount": load_csv(run_dir, "podcount.csv"),
-            "phases": load_phases(run_dir),
-            "prometheus": load_csv(run_dir, "prometheus_metrics.csv")
-            if (run_dir / "prometheus_metrics.csv").exists()
-            else pd.DataFrame(),
-            # Dedicated HTTP req/s collector output (new)
-            "http_rps": load_csv(run_dir, "http_rps.csv")
-            if (run_dir / "http_rps.csv").exists()
-            else pd.DataFrame(),
-        }
+        data[label] = LazyRun(run_dir)
+    if not data:
+        return data
+
+    with ThreadPoolExecutor(max_workers=len(data) * len(PREFETCH_KEYS)) as ex:
+        for run in data.values():
+            run.prefetch(ex, PREFETCH_KEYS)
     return data
 
 
+# id(run_data) → (run_data, result); holding run_data keeps its id from
+# being reused by another object while the entry exists
+_HTTP_RPS_CACHE = {}
+
+
+def get_http_rps_series(run_data) -> tuple:
+    """Pick the best HTTP req/s source for a run, memoized per run.
+
+    Returns (source, timestamps, rps) with timestamps as a DatetimeIndex
+    and rps as a NumPy array, or (None, None, None) when no source has data.
+    Source priority:
+      1. "http_rps"   — http_rps.csv total_rps (dedicated irate collector)
+      2. "hpa"        — hpa_log.csv httpRequestsPerSecond custom metric
+      3. "prometheus" — prometheus_metrics.csv per-pod rates summed per scrape
+    """
+    cached = _HTTP_RPS_CACHE.get(id(run_data))
+    if cached is None or cached[0] is not run_data:
+        cached = (run_data, _select_http_rps_series(run_data))
+        _HTTP_RPS_CACHE[id(run_data)] = cached
+    return cached[1]
+
+
+def _select_http_rps_series(run_data) -> tuple:
+    hpa = run_data["hpa_log"]
+    http_rps_df = run_data.get("http_rps", pd.DataFrame())
+
+    if not http_rps_df.empty and "total_rps" in http_rps_df.columns:
+        series = http_rps_df["total_rps"]
+        if not series.dropna().empty:
+            return (
+                "http_rps",
+                pd.DatetimeIndex(http_rps_df["timestamp"]),
+                series.to_numpy(),
+            )
+
+    if not hpa.empty and "httpRequestsPerSecond" in hpa.columns:
+        series = hpa["httpRequestsPerSecond"]
+        if not series.dropna().empty:
+            return "hpa", pd.DatetimeIndex(hpa["timestamp"]), series.to_numpy()
+
+    # Only read here: on a LazyRun this is what loads prometheus_metrics.csv
+    prom = run_data.get("prometheus", pd.DataFrame())
+    if not prom.empty and "metric" in prom.columns:
+        # Mask NumPy views instead of materialising a filtered DataFrame
+        mask = prom["metric"].to_numpy() == "http_requests_rate"
+        if mask.any():
+            rates = pd.Series(
+                prom["value"].to_numpy()[mask],
+                index=pd.DatetimeIndex(prom["timestamp"])[mask],
+            )
+            # The collector writes scrapes in time order, so group on the
+            # index without re-sorting and only sort if that ever breaks.
+            df_avg = rates.groupby(level=0, sort=False).sum()
+            if not df_avg.index.is_monotonic_increasing:
+                df_avg = df_avg.sort_index()
+            return "prometheus", df_avg.index, df_avg.to_numpy()
+
+    return None, None, None
+
+
 # ── Derived Metrics ───────────────────────────────────────────────────────────
 
 
+def _first_stable_run(seconds, replicas, min_duration_s=60):
+    """Index of the first sample of the first replica run lasting
+    >= min_duration_s, or -1. Runs are maximal stretches of equal
+    consecutive values; NaN samples never join a run.
+    """
+    starts = np.flatnonzero(np.r_[True, replicas[1:] != replicas[:-1]])
+    ends = np.r_[starts[1:], len(replicas)] - 1
+    stable = np.flatnonzero(seconds[ends] - seconds[starts] >= min_duration_s)
+    return int(starts[stable[0]]) if stable.size else -1
+
+
 def compute_derived_metrics(run_data: dict) -> dict:
     """Compute derived metrics for a single experiment run."""
     hpa = run_data["hpa_log"]
@@ -127,25 +345,20 @@ def compute_derived_metrics(run_data: dict) -> dict:
     # Time-to-stabilize
     stabilized_start_time = None
     if "currentReplicas" in hpa.columns and len(hpa) > 1:
-        stable_start = None
-        for i in range(1, len(hpa)):
-            if hpa.iloc[i]["currentReplicas"] == hpa.iloc[i - 1]["currentReplicas"]:
-                if stable_start is None:
-                    stable_start = hpa.iloc[i - 1]["timestamp"]
-                elapsed = (hpa.iloc[i]["timestamp"] - stable_start).total_seconds()
-                if elapsed >= 60:
-                    first_high = (
-                        high_starts.iloc[0]["timestamp"]
-                        if not high_starts.empty
-                        else hpa.iloc[0]["timestamp"]
-                    )
-                    metrics["time_to_stabilize_s"] = (
-                        stable_start - first_high
-                    ).total_seconds()
-                    stabilized_start_time = stable_start
-                    break
-            else:
-                stable_start = None
+        ts = hpa["timestamp"]
+        seconds = (ts - ts.iloc[0]).dt.total_seconds().to_numpy()
+        start_idx = _first_stable_run(seconds, hpa["currentReplicas"].to_numpy())
+        if start_idx >= 0:
+            stable_start = hpa["timestamp"].iloc[start_idx]
+            first_high = (
+                high_starts.iloc[0]["timestamp"]
+                if not high_starts.empty
+                else hpa.iloc[0]["timestamp"]
+            )
+            metrics["time_to_stabilize_s"] = (
+                stable_start - first_high
+            ).total_seconds()
+            stabilized_start_time = stable_start
 
     # Max replicas
     if "currentReplicas" in hpa.columns:
@@ -153,59 +366,28 @@ def compute_derived_metrics(run_data: dict) -> dict:
 
     # Average CPU utilization
     if "currentCPUUtilizationPercent" in hpa.columns:
-        cpu_col = pd.to_numeric(
-            hpa["currentCPUUtilizationPercent"], errors="coerce"
-        )
+        cpu_col = hpa["currentCPUUtilizationPercent"]
         if stabilized_start_time is not None:
             cpu_vals = cpu_col[hpa["timestamp"] >= stabilized_start_time]
         else:
             cpu_vals = cpu_col
-        metrics["avg_cpu_util"] = round(cpu_vals.dropna().mean(), 1)
+        metrics["avg_cpu_util"] = float(cpu_vals.dropna().mean())
 
-    # Average HTTP requests/s — prefer dedicated http_rps.csv, then fall back
-    avg_http_rps = None
-
-    # 1. Best source: dedicated http_rps.csv (irate-based, cluster-wide total)
-    http_rps_df = run_data.get("http_rps", pd.DataFrame())
-    if not http_rps_df.empty and "total_rps" in http_rps_df.columns:
-        vals = pd.to_numeric(http_rps_df["total_rps"], errors="coerce").dropna()
-        if not vals.empty:
-            avg_http_rps = vals.mean()
-            metrics["peak_http_rps"] = round(float(vals.max()), 2)
-
-    # 2. Fallback: HPA custom metric field
-    if avg_http_rps is None and "httpRequestsPerSecond" in hpa.columns:
-        http_col = pd.to_numeric(hpa["httpRequestsPerSecond"], errors="coerce")
-        if not http_col.dropna().empty:
-            avg_http_rps = http_col.dropna().mean()
-
-    # 3. Fallback: prometheus_metrics.csv
-    if avg_http_rps is None:
-        prom = run_data.get("prometheus", pd.DataFrame())
-        if not prom.empty and "metric" in prom.columns:
-            prom_rates = prom[prom["metric"] == "http_requests_rate"]
-            if not prom_rates.empty:
-                vals = pd.to_numeric(prom_rates["value"], errors="coerce")
-                avg_http_rps = vals.dropna().mean()
-
-    if avg_http_rps is not None:
-        metrics["avg_http_rps"] = round(float(avg_http_rps), 2)
+    # Average HTTP requests/s — same source the rate plot uses
+    source, _, rps = get_http_rps_series(run_data)
+    if source == "http_rps":
+        metrics["peak_http_rps"] = float(np.nanmax(rps))
+    if source is not None:
+        metrics["avg_http_rps"] = float(np.nanmean(rps))
 
     # Overshoot/undershoot area (CPU)
     if "currentCPUUtilizationPercent" in hpa.columns:
         hpa_sorted = hpa.sort_values("timestamp")
-        area = 0.0
-        prev_time = hpa_sorted.iloc[0]["timestamp"]
-        for _, row in hpa_sorted.iterrows():
-            curr_time = row["timestamp"]
-            dt = (curr_time - prev_time).total_seconds()
-            util = pd.to_numeric(
-                row["currentCPUUtilizationPercent"], errors="coerce"
-            )
-            if pd.notna(util):
-                area += abs(util - TARGET_CPU_UTIL) * dt
-            prev_time = curr_time
-        metrics["overshoot_undershoot_area"] = round(area, 1)
+        util = hpa_sorted["currentCPUUtilizationPercent"].to_numpy()
+        # Rectangle integration; the first sample has dt = 0
+        dt = hpa_sorted["timestamp"].diff().dt.total_seconds().fillna(0).to_numpy()
+        area = np.nansum(np.abs(util - TARGET_CPU_UTIL) * dt)
+        metrics["overshoot_undershoot_area"] = float(area)
 
     # Resource cost (pod-seconds)
     if "currentReplicas" in hpa.columns:
@@ -214,21 +396,12 @@ def compute_derived_metrics(run_data: dict) -> dict:
     # Pod CPU variance
     pod_cpu_df = run_data.get("pod_cpu", pd.DataFrame())
     if not pod_cpu_df.empty and "cpu" in pod_cpu_df.columns:
-
-        def parse_cpu(val):
-            val = str(val).strip()
-            if val.endswith("m"):
-                return int(val[:-1])
-            try:
-                return int(float(val) * 1000)
-            except ValueError:
-                return None
-
-        try:
-            cpu_milli = pod_cpu_df["cpu"].apply(parse_cpu).dropna()
-            metrics["pod_cpu_std_dev"] = round(cpu_milli.std(), 1)
-        except Exception:
-            pass
+        # kubectl top reports millicores ("250m") or whole cores ("1")
+        cpu_str = pod_cpu_df["cpu"].astype(str).str.strip()
+        is_milli = cpu_str.str.endswith("m")
+        cpu_num = pd.to_numeric(cpu_str.str.rstrip("m"), errors="coerce")
+        cpu_milli = np.where(is_milli, cpu_num, np.trunc(cpu_num * 1000))
+        metrics["pod_cpu_std_dev"] = float(np.nanstd(cpu_milli, ddof=1))
 
     return metrics
 
@@ -236,60 +409,106 @@ def compute_derived_metrics(run_data: dict) -> dict:
 # ── Plotting ──────────────────────────────────────────────────────────────────
 
 
+def lttb(x, y, n_out: int = MAX_PLOT_POINTS):
+    """Downsample a line to n_out points with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the next bucket's mean, so peaks and steps survive. NaN samples are
+    only kept when a whole bucket is NaN.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = (hi, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        next_y = y[nlo:nhi]
+        next_y = next_y[~np.isnan(next_y)]
+        avg_x = x[nlo:nhi].mean()
+        avg_y = next_y.mean() if next_y.size else y[a]
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def prepare_run(run_data) -> dict:
+    """Extract the hpa_log arrays shared by the plot functions.
+
+    Returns {} when the run has no hpa_log data. Otherwise returns "t0"
+    and "minutes" since t0, plus "replicas", "desired" and "cpu" as
+    NumPy arrays for whichever of those columns the log has.
+    """
+    hpa = run_data["hpa_log"]
+    if hpa.empty:
+        return {}
+    t0 = hpa["timestamp"].iloc[0]
+    prepared = {
+        "t0": t0,
+        "minutes": (hpa["timestamp"] - t0).dt.total_seconds().to_numpy() / 60,
+    }
+    for key, col in (
+        ("replicas", "currentReplicas"),
+        ("desired", "desiredReplicas"),
+        ("cpu", "currentCPUUtilizationPercent"),
+    ):
+        if col in hpa.columns:
+            prepared[key] = hpa[col].to_numpy()
+    return prepared
+
+
 def add_phase_shading(ax, phases_df, t0):
     """Add shaded regions for high/low phases."""
     if phases_df.empty:
         return
-    high_starts = phases_df[
-        (phases_df["phase"] == "high") & (phases_df["action"] == "start")
-    ]
-    high_ends = phases_df[
-        (phases_df["phase"] == "high") & (phases_df["action"] == "end")
-    ]
-    for _, start_row in high_starts.iterrows():
-        s = (start_row["timestamp"] - t0).total_seconds() / 60
-        # Find matching end
-        matching_ends = high_ends[high_ends["timestamp"] > start_row["timestamp"]]
-        if not matching_ends.empty:
-            e = (matching_ends.iloc[0]["timestamp"] - t0).total_seconds() / 60
-            ax.axvspan(s, e, alpha=0.1, color="red", label=None)
-
-
-def plot_replicas_over_time(data: dict):
+    high = (phases_df["phase"] == "high").to_numpy()
+    action = phases_df["action"].to_numpy()
+    minutes = (phases_df["timestamp"] - t0).dt.total_seconds().to_numpy() / 60
+    starts = minutes[high & (action == "start")]
+    ends = np.sort(minutes[high & (action == "end")])
+    # Pair each start with the first end strictly after it
+    idx = np.searchsorted(ends, starts, side="right")
+    matched = idx < len(ends)
+    for s, e in zip(starts[matched], ends[idx[matched]]):
+        ax.axvspan(s, e, alpha=0.1, color="red", label=None)
+
+
+def plot_replicas_over_time(prepared: dict):
     """Plot pod replicas vs time for all experiments."""
     fig, ax = plt.subplots(figsize=(14, 6))
-    for label, run_data in data.items():
-        hpa = run_data["hpa_log"]
-        if hpa.empty or "currentReplicas" not in hpa.columns:
+    for label, prep in prepared.items():
+        if "replicas" not in prep:
             continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-        ax.plot(minutes, hpa["currentReplicas"], label=label, linewidth=1.5)
+        ax.plot(*lttb(prep["minutes"], prep["replicas"]), label=label, linewidth=1.5)
 
     ax.set_xlabel("Time (minutes)")
     ax.set_ylabel("Replicas")
     ax.set_title("Pod Replicas Over Time (PCM Experiments)")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**FIG_MARGINS)
     fig.savefig(OUTPUT_DIR / "replicas_over_time.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'replicas_over_time.png'}")
 
 
-def plot_cpu_over_time(data: dict):
+def plot_cpu_over_time(prepared: dict):
     """Plot average CPU utilization vs time."""
     fig, ax = plt.subplots(figsize=(14, 6))
-    for label, run_data in data.items():
-        hpa = run_data["hpa_log"]
-        if hpa.empty or "currentCPUUtilizationPercent" not in hpa.columns:
+    for label, prep in prepared.items():
+        if "cpu" not in prep:
             continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-        cpuutil = pd.to_numeric(
-            hpa["currentCPUUtilizationPercent"], errors="coerce"
-        )
-        ax.plot(minutes, cpuutil, label=label, linewidth=1.5)
+        ax.plot(*lttb(prep["minutes"], prep["cpu"]), label=label, linewidth=1.5)
 
     ax.axhline(
         y=TARGET_CPU_UTIL,
@@ -303,7 +522,7 @@ def plot_cpu_over_time(data: dict):
     ax.set_title("HPA CPU Utilization Over Time (PCM Experiments)")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**FIG_MARGINS)
     fig.savefig(OUTPUT_DIR / "cpu_over_time.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'cpu_over_time.png'}")
@@ -312,53 +531,24 @@ def plot_cpu_over_time(data: dict):
 def plot_http_rate_over_time(data: dict):
     """Plot HTTP request rate (req/s) over time for all experiments.
 
-    Data source priority:
-      1. http_rps.csv — dedicated irate collector (most accurate)
-      2. hpa_log.csv  — httpRequestsPerSecond from HPA custom metric
-      3. prometheus_metrics.csv — rate(http_requests_total[30s]) per pod
+    The data source for each run is chosen by get_http_rps_series().
     """
     fig, ax = plt.subplots(figsize=(14, 6))
     has_data = False
 
     for label, run_data in data.items():
+        source, timestamps, rps = get_http_rps_series(run_data)
+        if source is None:
+            continue
+        # Prometheus scrapes are aligned to the HPA log when there is one
         hpa = run_data["hpa_log"]
-        http_rps_df = run_data.get("http_rps", pd.DataFrame())
-        prom = run_data.get("prometheus", pd.DataFrame())
-
-        rps_series = None
-        times = None
-
-        # ── Source 1: dedicated http_rps.csv (total_rps = irate sum) ──────────
-        if not http_rps_df.empty and "total_rps" in http_rps_df.columns:
-            series = pd.to_numeric(http_rps_df["total_rps"], errors="coerce")
-            if not series.dropna().empty:
-                rps_series = series
-                t0 = http_rps_df["timestamp"].iloc[0]
-                times = (http_rps_df["timestamp"] - t0).dt.total_seconds() / 60
-
-        # ── Source 2: HPA custom metric httpRequestsPerSecond ─────────────────
-        if rps_series is None and not hpa.empty and "httpRequestsPerSecond" in hpa.columns:
-            series = pd.to_numeric(hpa["httpRequestsPerSecond"], errors="coerce")
-            if not series.dropna().empty:
-                rps_series = series
-                t0 = hpa["timestamp"].iloc[0]
-                times = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-
-        # ── Source 3: prometheus_metrics.csv — per-pod rate averaged ─────────
-        if rps_series is None and not prom.empty and "metric" in prom.columns:
-            prom_rates = prom[prom["metric"] == "http_requests_rate"].copy()
-            if not prom_rates.empty:
-                prom_rates["value"] = pd.to_numeric(prom_rates["value"], errors="coerce")
-                df_avg = prom_rates.groupby("timestamp")["value"].sum().reset_index()
-                df_avg = df_avg.sort_values("timestamp")
-                if not df_avg.empty:
-                    rps_series = df_avg["value"]
-                    t0 = hpa["timestamp"].iloc[0] if not hpa.empty else df_avg["timestamp"].iloc[0]
-                    times = (df_avg["timestamp"] - t0).dt.total_seconds() / 60
-
-        if rps_series is not None and times is not None:
-            has_data = True
-            ax.plot(times, rps_series.values, label=label, linewidth=1.5)
+        if source == "prometheus" and not hpa.empty:
+            t0 = hpa["timestamp"].iloc[0]
+        else:
+            t0 = timestamps[0]
+        times = (timestamps - t0).total_seconds().to_numpy() / 60
+        has_data = True
+        ax.plot(*lttb(times, rps), label=label, linewidth=1.5)
 
     if not has_data:
         plt.close(fig)
@@ -370,33 +560,32 @@ def plot_http_rate_over_time(data: dict):
     ax.set_title("HTTP Request Rate Over Time (PCM Experiments)")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**FIG_MARGINS)
     fig.savefig(OUTPUT_DIR / "http_rate_over_time.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'http_rate_over_time.png'}")
 
 
-def plot_desired_vs_current(data: dict):
+def plot_desired_vs_current(prepared: dict):
     """Plot HPA desired vs current replicas for each experiment."""
-    n = len(data)
+    n = len(prepared)
     if n == 0:
         return
     fig, axes = plt.subplots(1, min(n, 5), figsize=(6 * min(n, 5), 5), sharey=True)
     if n == 1:
         axes = [axes]
 
-    for ax, (label, run_data) in zip(axes, list(data.items())[:5]):
-        hpa = run_data["hpa_log"]
-        if hpa.empty:
+    for ax, (label, prep) in zip(axes, list(prepared.items())[:5]):
+        if not prep:
             continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-        if "currentReplicas" in hpa.columns:
-            ax.plot(minutes, hpa["currentReplicas"], label="current", linewidth=1.5)
-        if "desiredReplicas" in hpa.columns:
+        minutes = prep["minutes"]
+        if "replicas" in prep:
             ax.plot(
-                minutes,
-                hpa["desiredReplicas"],
+                *lttb(minutes, prep["replicas"]), label="current", linewidth=1.5
+            )
+        if "desired" in prep:
+            ax.plot(
+                *lttb(minutes, prep["desired"]),
                 label="desired",
                 linestyle="--",
                 linewidth=1.5,
@@ -408,36 +597,34 @@ def plot_desired_vs_current(data: dict):
 
     axes[0].set_ylabel("Replicas")
     fig.suptitle("HPA Desired vs Current Replicas (PCM)", fontsize=14)
-    fig.tight_layout()
+    fig.subplots_adjust(**{**FIG_MARGINS, "top": 0.85})  # room for suptitle
     fig.savefig(OUTPUT_DIR / "desired_vs_current.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'desired_vs_current.png'}")
 
 
-def plot_pcm_h_vs_pcm_ch(data: dict):
+def plot_pcm_h_vs_pcm_ch(prepared: dict):
     """Side-by-side comparison of PCM-H and PCM-CH (paper Section 5.2.6)."""
-    if "pcm-h" not in data or "pcm-ch" not in data:
+    if "pcm-h" not in prepared or "pcm-ch" not in prepared:
         print("  [SKIP] Need both pcm-h and pcm-ch data for comparison plot")
         return
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
     for label in ["pcm-h", "pcm-ch"]:
-        hpa = data[label]["hpa_log"]
-        if hpa.empty:
+        prep = prepared[label]
+        if not prep:
             continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
+        minutes = prep["minutes"]
 
         # CPU
-        if "currentCPUUtilizationPercent" in hpa.columns:
-            cpu = pd.to_numeric(hpa["currentCPUUtilizationPercent"], errors="coerce")
-            axes[0].plot(minutes, cpu, label=label, linewidth=1.5)
+        if "cpu" in prep:
+            axes[0].plot(*lttb(minutes, prep["cpu"]), label=label, linewidth=1.5)
 
         # Replicas
-        if "currentReplicas" in hpa.columns:
+        if "replicas" in prep:
             axes[1].plot(
-                minutes, hpa["currentReplicas"], label=label, linewidth=1.5
+                *lttb(minutes, prep["replicas"]), label=label, linewidth=1.5
             )
 
     axes[0].set_title("CPU Utilization (%)")
@@ -451,36 +638,31 @@ def plot_pcm_h_vs_pcm_ch(data: dict):
     axes[1].grid(True, alpha=0.3)
 
     fig.suptitle("PCM-H vs PCM-CH Comparison (Paper Section 5.2.6)", fontsize=14)
-    fig.tight_layout()
+    fig.subplots_adjust(**{**FIG_MARGINS, "top": 0.85, "wspace": 0.15})
     fig.savefig(OUTPUT_DIR / "pcm_h_vs_pcm_ch.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'pcm_h_vs_pcm_ch.png'}")
 
 
-def plot_efficiency_scatter(data: dict):
+def plot_efficiency_scatter(prepared: dict):
     """Scatter of Replicas vs CPU Utilization."""
     fig, ax = plt.subplots(figsize=(10, 6))
-    for label, run_data in data.items():
-        hpa = run_data["hpa_log"]
-        if (
-            hpa.empty
-            or "currentReplicas" not in hpa.columns
-            or "currentCPUUtilizationPercent" not in hpa.columns
-        ):
+    for label, prep in prepared.items():
+        if "replicas" not in prep or "cpu" not in prep:
             continue
-        df = hpa.dropna(subset=["currentReplicas", "currentCPUUtilizationPercent"])
-        if df.empty:
+        valid = ~np.isnan(prep["replicas"]) & ~np.isnan(prep["cpu"])
+        if not valid.any():
             continue
-        replicas = df["currentReplicas"]
-        cpu = pd.to_numeric(df["currentCPUUtilizationPercent"], errors="coerce")
-        ax.scatter(replicas, cpu, alpha=0.4, s=30, label=label)
+        ax.scatter(
+            prep["replicas"][valid], prep["cpu"][valid], alpha=0.4, s=30, label=label
+        )
 
     ax.set_xlabel("Replicas")
     ax.set_ylabel("CPU Utilization (%)")
     ax.set_title("Scaling Efficiency: CPU vs Replicas (PCM)")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    fig.subplots_adjust(**{**FIG_MARGINS, "left": 0.09})
     fig.savefig(OUTPUT_DIR / "efficiency_scatter.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'efficiency_scatter.png'}")
@@ -489,10 +671,10 @@ def plot_efficiency_scatter(data: dict):
 # ── Scraping Period Comparison (PCM-CPU) ──────────────────────────────────────
 
 
-def plot_scraping_period_comparison(data: dict):
+def plot_scraping_period_comparison(prepared: dict):
     """Compare PCM-CPU with different scraping periods (60s, 30s, 15s)."""
     scrape_data = {
-        k: v for k, v in data.items() if k.startswith("pcm-cpu-")
+        k: v for k, v in prepared.items() if k.startswith("pcm-cpu-")
     }
     if len(scrape_data) < 2:
         print("  [SKIP] Need ≥2 PCM-CPU scraping period runs for comparison")
@@ -500,16 +682,10 @@ def plot_scraping_period_comparison(data: dict):
 
     fig, ax = plt.subplots(figsize=(8, 5))
 
-    for label, run_data in scrape_data.items():
-        hpa = run_data["hpa_log"]
-        if hpa.empty:
-            continue
-        t0 = hpa["timestamp"].iloc[0]
-        minutes = (hpa["timestamp"] - t0).dt.total_seconds() / 60
-
-        if "currentReplicas" in hpa.columns:
+    for label, prep in scrape_data.items():
+        if "replicas" in prep:
             ax.plot(
-                minutes, hpa["currentReplicas"], label=label, linewidth=1.5
+                *lttb(prep["minutes"], prep["replicas"]), label=label, linewidth=1.5
             )
 
     ax.set_title("Replicas Over Time")
@@ -519,7 +695,7 @@ def plot_scraping_period_comparison(data: dict):
     ax.grid(True, alpha=0.3)
 
     fig.suptitle("PCM-CPU: Scraping Period Comparison", fontsize=14)
-    fig.tight_layout()
+    fig.subplots_adjust(**{**FIG_MARGINS, "left": 0.11, "top": 0.85})
     fig.savefig(OUTPUT_DIR / "scraping_period_comparison.png", dpi=150)
     plt.close(fig)
     print(f"  → {OUTPUT_DIR / 'scraping_period_comparison.png'}")
@@ -542,13 +718,14 @@ def main():
 
     # Generate plots
     print("\n[PLOTS]")
-    plot_replicas_over_time(data)
-    plot_cpu_over_time(data)
+    prepared = {label: prepare_run(run_data) for label, run_data in data.items()}
+    plot_replicas_over_time(prepared)
+    plot_cpu_over_time(prepared)
     plot_http_rate_over_time(data)
-    plot_desired_vs_current(data)
-    plot_efficiency_scatter(data)
-    plot_pcm_h_vs_pcm_ch(data)
-    plot_scraping_period_comparison(data)
+    plot_desired_vs_current(prepared)
+    plot_efficiency_scatter(prepared)
+    plot_pcm_h_vs_pcm_ch(prepared)
+    plot_scraping_period_comparison(prepared)
 
     # Compute derived metrics
     print("\n[DERIVED METRICS]")
@@ -556,15 +733,22 @@ def main():
     for label, run_data in data.items():
         metrics = compute_derived_metrics(run_data)
         summary[label] = metrics
-        print(f"  {label}: {metrics}")
+        shown = {
+            k: round(v, 2) if isinstance(v, float) else v for k, v in metrics.items()
+        }
+        print(f"  {label}: {shown}")
 
     # Summary table
     if summary:
-        df_summary = pd.DataFrame(summary).T
-        df_summary.index.name = "experiment"
+        df_summary = pd.DataFrame.from_records(
+            list(summary.values()),
+            index=pd.Index(list(summary.keys()), name="experiment"),
+        )
         print("\n=== Summary Table ===")
-        print(df_summary.to_string())
-        df_summary.to_csv(OUTPUT_DIR / "summary_table.csv")
+        print(df_summary.to_string(float_format=lambda x: FLOAT_FORMAT % x))
+        df_summary.to_csv(
+            OUTPUT_DIR / "summary_table.csv", float_format=FLOAT_FORMAT
+        )
         print(f"\n  → {OUTPUT_DIR / 'summary_table.csv'}")
 
     print("\n[DONE] All outputs in:", OUTPUT_DIR)
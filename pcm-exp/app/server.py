@@ -10,39 +10,78 @@ On each request to /:
 Exposes /metrics in Prometheus exposition format.
 """
 
+import itertools
 import time
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 # ── Prometheus metrics (manual implementation, no external deps) ──────────────
 
-REQUESTS_TOTAL = 0
-REQUESTS_LOCK = threading.Lock()
+# next() on itertools.count is atomic under the GIL, so the request path
+# never takes a lock. A scrape reads the counter by consuming one value from
+# it too; _SCRAPES counts those reads so they can be subtracted out. The
+# lock only serialises scrapes, keeping the two next() calls paired.
+_REQUEST_IDS = itertools.count()
+_SCRAPES = itertools.count()
+_REPORT_LOCK = threading.Lock()
 
 
 def increment_requests():
-    global REQUESTS_TOTAL
-    with REQUESTS_LOCK:
-        REQUESTS_TOTAL += 1
+    next(_REQUEST_IDS)
 
 
 def get_requests_total():
-    with REQUESTS_LOCK:
-        return REQUESTS_TOTAL
+    with _REPORT_LOCK:
+        return next(_REQUEST_IDS) - next(_SCRAPES)
 
 
 # ── CPU burn ──────────────────────────────────────────────────────────────────
 
+# Loop iterations per millisecond of CPU, measured once by calibrate_burn()
+ITERATIONS_PER_MS = 10_000
+
+
+def _burn(n):
+    x = 0
+    for i in range(n):
+        x += i * i
+    return x
+
+
+def calibrate_burn(probe=200_000, rounds=5):
+    """Measure how many _burn iterations fit in a millisecond on this host."""
+    global ITERATIONS_PER_MS
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _burn(probe)
+        best = min(best, time.perf_counter() - start)
+    ITERATIONS_PER_MS = max(1, int(probe / (best * 1000.0)))
+    return ITERATIONS_PER_MS
+
+
 def burn_cpu(duration_ms=50):
-    """Burn CPU for approximately duration_ms milliseconds."""
-    end = time.monotonic() + (duration_ms / 1000.0)
-    while time.monotonic() < end:
-        _ = sum(i * i for i in range(100))
+    """Burn a fixed amount of CPU calibrated to ~duration_ms milliseconds."""
+    _burn(ITERATIONS_PER_MS * duration_ms)
 
 
 # ── HTTP Handler ──────────────────────────────────────────────────────────────
 
+# Complete response for the hot "/" path, encoded once and sent in one write
+_OK_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 3\r\n"
+    b"\r\n"
+    b"OK\n"
+)
+
+
 class AppHandler(BaseHTTPRequestHandler):
+    # Keep-alive so the load generator reuses connections instead of paying
+    # a TCP handshake per request
+    protocol_version = "HTTP/1.1"
+
     def do_GET(self):
         if self.path == "/metrics":
             self._serve_metrics()
@@ -54,7 +93,7 @@ class AppHandler(BaseHTTPRequestHandler):
     def _serve_request(self):
         increment_requests()
         burn_cpu(50)
-        self._send_response(200, "OK\n")
+        self.wfile.write(_OK_RESPONSE)
 
     def _serve_metrics(self):
         total = get_requests_total()
@@ -66,10 +105,12 @@ class AppHandler(BaseHTTPRequestHandler):
         self._send_response(200, body, content_type="text/plain; version=0.0.4")
 
     def _send_response(self, code, body, content_type="text/plain"):
+        payload = body.encode()
         self.send_response(code)
         self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
         self.end_headers()
-        self.wfile.write(body.encode())
+        self.wfile.write(payload)
 
     def log_message(self, format, *args):
         # Suppress per-request logs to reduce noise
@@ -80,8 +121,10 @@ class AppHandler(BaseHTTPRequestHandler):
 
 if __name__ == "__main__":
     port = 8080
-    server = HTTPServer(("0.0.0.0", port), AppHandler)
+    calibrate_burn()
+    server = ThreadingHTTPServer(("0.0.0.0", port), AppHandler)
     print(f"[cpu-http-app] listening on :{port}")
+    print(f"  burn calibration: {ITERATIONS_PER_MS} iterations/ms")
     print(f"  GET /         → burn CPU + count request")
     print(f"  GET /metrics  → Prometheus metrics")
     print(f"  GET /healthz  → health check")